@@ -1,12 +1,61 @@
 """
-This module defines two lists of strings representing affirmative and 
+This module defines two sets of strings representing affirmative and 
 negative responses.
     
-TRUE : list
-    A list of strings representing affirmative responses.
+TRUE : frozenset
+    A set of strings representing affirmative responses.
 
-FALSE : list
-    A list of strings representing negative responses.
+FALSE : frozenset
+    A set of strings representing negative responses.
+
+VALID : frozenset
+    The set of all accepted responses.
+
+classify : function
+    Maps a response to True, False or None with a single table lookup.
+
+YesNoFilter : class
+    A message filter accepting only messages whose text is an accepted response.
+
+All responses are casefolded, so user input must be casefolded before lookup.
 """
-TRUE = ["yes", "y", "si", "yeah", "yep"]
-FALSE = ["no", "n", "nope", "nah"]
+from typing import Optional
+
+from telegram import Message
+from telegram.ext import filters
+
+TRUE = frozenset({"yes", "y", "si", "yeah", "yep"})
+FALSE = frozenset({"no", "n", "nope", "nah"})
+VALID = TRUE | FALSE
+
+
+def _key(text: str):
+    """Perfect hash of the accepted responses: their length and last character."""
+    return len(text), text[-1:]
+
+
+TABLE = {_key(word): (word, word in TRUE) for word in VALID}
+if len(TABLE) != len(VALID):
+    raise ValueError("Accepted responses must differ in length or last character")
+
+
+def classify(text: str) -> Optional[bool]:
+    """
+    Classifies a casefolded response.
+
+    Args:
+    - text (str): The casefolded response.
+
+    Returns:
+    - Optional[bool]: True if affirmative, False if negative, None if not accepted.
+    """
+    entry = TABLE.get(_key(text))
+    return entry[1] if entry and entry[0] == text else None
+
+
+class YesNoFilter(filters.MessageFilter):
+    """Accepts messages whose text is one of the accepted inputs, ignoring case."""
+
+    def filter(self, message: Message) -> bool:
+        """Checks the casefolded message text against the set of accepted inputs."""
+        return bool(message.text) and message.text.casefold() in VALID
@@ -5,7 +5,6 @@ Usage:
 Send /start to initiate the conversation.
 Send /cancel to stop the conversation.
 """
-import re
 import requests
 from requests.exceptions import RequestException
 
@@ -14,32 +13,29 @@ from telegram.ext import (
     CommandHandler,
     ConversationHandler,
     MessageHandler,
-    filters,
 )
 from decouple import config
 
-from chatbot.states import cancel, check_photo, STATES
-from chatbot.inputs import FALSE, TRUE
+from chatbot.states import answer, cancel, start, STATES
+from chatbot.inputs import YesNoFilter
 
 BOT_URL = f"https://api.telegram.org/bot{config('TELEGRAM_BOT_TOKEN')}"
 
 
+# Built once at import and shared by every handler that needs it
+_YESNO_FILTER = YesNoFilter()
+
+
 def main() -> None:
     """Run the bot."""
     # Create the Application
     application = Application.builder().token(config("TELEGRAM_BOT_TOKEN")).build()
 
-    # Construct regular expression to match accepted inputs
-    regex_str = f"^({'|'.join(TRUE + FALSE)})$"
-    regex_pattern = re.compile(regex_str, re.IGNORECASE)
-
     # Add conversation handler with the states
     conv_handler = ConversationHandler(
-        entry_points=[CommandHandler("start", check_photo)],
+        entry_points=[CommandHandler("start", start)],
         states={
-            STATES.CHECK_PHOTO: [
-                MessageHandler(filters.Regex(regex_pattern), check_photo)
-            ],
+            STATES.CHECK_PHOTO: [MessageHandler(_YESNO_FILTER, answer)],
         },
         fallbacks=[CommandHandler("cancel", cancel)],
     )
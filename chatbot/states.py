@@ -4,17 +4,18 @@ checking whether a rocket has taken off from a video. The functions included are
 
 - get_or_create_bisector: gets or creates a FrameXBisector object from the user_data 
     of the context.
-- check_photo: sends a photo and asks the user whether the rocket has taken off. 
-    Uses the FrameXBisector object to process the user's response and bisect the
-    video to find the frame where the rocket took off.
+- start: handles /start, warming up the bisector and showing the first photo.
+- answer: uses the FrameXBisector object to process the user's response and
+    bisect the video to find the frame where the rocket took off.
 - cancel: cancels the conversation.
 
 The module uses the logging and telegram libraries for logging and interacting 
 with the Telegram API.
 """
+import logging
 from enum import Enum
 
-from telegram import ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
+from telegram import Message, ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
 from telegram.ext import (
     ContextTypes,
     ConversationHandler,
@@ -22,7 +23,7 @@ from telegram.ext import (
 
 from video.bisector import FrameXBisector
 from health.log import logger
-from chatbot.inputs import TRUE
+from chatbot.inputs import classify
 
 
 class STATES(Enum):
@@ -49,53 +50,92 @@ def get_or_create_bisector(context: ContextTypes.DEFAULT_TYPE):
     Returns:
     - FrameXBisector: Bisector instance from context user data.
     """
-    return context.user_data.setdefault("bisector", FrameXBisector())
+    bisector = context.user_data.get("bisector")
+    if bisector is None:
+        bisector = context.user_data["bisector"] = FrameXBisector()
+    return bisector
 
 
-async def check_photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """
-    Sends the photo and asks if rocket has taken off.
+    Starts the bisection and shows the first photo.
 
     Args:
-    - update (telegram.Update): Incoming message from user.
+    - update (telegram.Update): Incoming /start command from user.
     - context (telegram.ext.Context): Context in which the message is processed.
 
     Returns:
     - int: ConversationHandler.END if the bisector is finished; otherwise, STATES.CHECK_PHOTO.
     """
+    bisector = get_or_create_bisector(context)
+    message = update.message
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s input: %s", message.from_user, message.text)
+    logger.info("Video with %s frames", bisector.count)
+    bisector.warmup()
+
+    return await _show_frame(message, context, bisector)
+
 
+async def answer(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """
+    Processes the user's answer and shows the next photo.
+
+    Args:
+    - update (telegram.Update): Incoming answer from user.
+    - context (telegram.ext.Context): Context in which the message is processed.
+
+    Returns:
+    - int: ConversationHandler.END if the bisector is finished; otherwise, STATES.CHECK_PHOTO.
+    """
     bisector = get_or_create_bisector(context)
-    logger.info("%s input: %s", update.message.from_user, update.message.text)
+    message = update.message
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s input: %s", message.from_user, message.text)
+    bisector.process_input(classify(message.text.casefold()) is True)
+
+    return await _show_frame(message, context, bisector)
 
-    # Process user input
-    if update.message.text == "/start":
-        logger.info("Video with %s frames", bisector.count)
-    else:
-        bisector.process_input(update.message.text.lower() in TRUE)
 
+async def _show_frame(
+    message: Message, context: ContextTypes.DEFAULT_TYPE, bisector: FrameXBisector
+) -> int:
+    """
+    Sends the photo and asks if rocket has taken off, or sends the takeoff frame
+    once the bisector is finished.
+
+    Args:
+    - message (telegram.Message): Incoming message from user.
+    - context (telegram.ext.Context): Context in which the message is processed.
+    - bisector (FrameXBisector): The user's bisector.
+
+    Returns:
+    - int: ConversationHandler.END if the bisector is finished; otherwise, STATES.CHECK_PHOTO.
+    """
     if bisector.is_finished:
         # Get found index
         bisector.go_to_mid()
         logger.info("Takeoff happened at frame %s", bisector.index)
 
-        await update.message.reply_text(
+        await message.reply_text(
             f"Takeoff happened at frame {bisector.index}!",
             reply_markup=ReplyKeyboardRemove(),
         )
-        await context.bot.send_photo(update.message.chat.id, bisector.image)
+        await context.bot.send_photo(message.chat.id, bisector.image)
         bisector.reset()
         return ConversationHandler.END
 
     # Run bisector
     bisector.go_to_mid()
-    logger.info(
-        "Testing %s in [%s : %s]", bisector.index, bisector.left, bisector.right
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Testing %s in [%s : %s]", bisector.index, bisector.left, bisector.right
+        )
 
     # Show mid frame to user
-    await context.bot.send_photo(update.message.chat.id, bisector.image)
+    await context.bot.send_photo(message.chat.id, bisector.image)
     # Ask user if rocket has taken off
-    await update.message.reply_text(
+    await message.reply_text(
         "Has the rocket taken off?",
         reply_markup=ReplyKeyboardMarkup(
             [OPTIONS],
@@ -106,9 +146,10 @@ async def check_photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int
     return STATES.CHECK_PHOTO
 
 
-async def cancel(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> int:
+async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """
-    Cancels and ends the conversation.
+    Cancels and ends the conversation, resetting the user's bisector so it does not
+    keep its downloaded frames.
 
     Args:
     - update (telegram.Update): Incoming message from user.
@@ -119,6 +160,9 @@ async def cancel(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> int:
     """
     user = update.message.from_user
     logger.info("User %s canceled the conversation.", user.first_name)
+    bisector = context.user_data.get("bisector")
+    if bisector is not None:
+        bisector.reset()
     await update.message.reply_text(
         "Bye! I hope we can talk again some day.", reply_markup=ReplyKeyboardRemove()
     )
@@ -0,0 +1,63 @@
+"""
+Unit tests for the accepted chatbot inputs.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from chatbot.inputs import TRUE, VALID, YesNoFilter, classify
+
+
+class TestClassify(unittest.TestCase):
+    """
+    Unit tests for the classify function.
+    """
+
+    def test_accepted_responses(self):
+        """
+        Tests that every accepted response is classified as affirmative or negative.
+        """
+        for word in VALID:
+            with self.subTest(word=word):
+                self.assertEqual(classify(word), word in TRUE)
+
+    def test_near_misses(self):
+        """
+        Tests that responses sharing a table key with an accepted response, but
+        not matching it, and the empty response are not accepted.
+        """
+        for word in ["yeh", "nape", "yas", ""]:
+            with self.subTest(word=word):
+                self.assertIsNone(classify(word))
+
+
+class TestYesNoFilter(unittest.TestCase):
+    """
+    Unit tests for the YesNoFilter class.
+    """
+
+    def setUp(self):
+        """
+        Create the filter under test.
+        """
+        self.yes_no_filter = YesNoFilter()
+
+    def test_accepted_responses(self):
+        """
+        Tests that accepted responses pass the filter whatever their case.
+        """
+        for text in ["yes", "YES", "Nope", "n"]:
+            with self.subTest(text=text):
+                self.assertTrue(self.yes_no_filter.filter(Mock(text=text)))
+
+    def test_rejected_messages(self):
+        """
+        Tests that messages without text, or with any other text, are rejected.
+        """
+        for text in [None, "", "maybe", "/start"]:
+            with self.subTest(text=text):
+                self.assertFalse(self.yes_no_filter.filter(Mock(text=text)))
+
+
+if __name__ == "__main__":
+    unittest.main()
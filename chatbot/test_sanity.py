@@ -19,7 +19,6 @@ Methods:
 
 import unittest
 import subprocess
-import time
 
 RUNTIME_SECONDS_SANITY_CHECK = 10
 
@@ -42,8 +41,8 @@ class TestSanity(unittest.TestCase):
         Test that the chatbot runs for at least 10 seconds without exiting.
 
         Uses subprocess.Popen to run the chatbot in a separate process and
-        checks that the process has not exited for at least 10 seconds using
-        time.monotonic().
+        waits on it with a 10 second timeout; the test passes only if the
+        wait times out with the process still running.
 
         """
         self.process = subprocess.Popen(
@@ -53,16 +52,13 @@ class TestSanity(unittest.TestCase):
             shell=True,
         )
 
-        start_time = time.monotonic()
-        exit_code = self.process.poll()
         print(f"Waiting {RUNTIME_SECONDS_SANITY_CHECK} seconds...")
-        while (
-            time.monotonic() < start_time + RUNTIME_SECONDS_SANITY_CHECK
-            or exit_code is not None
-        ):
-            exit_code = self.process.poll()
+        try:
+            exit_code = self.process.wait(timeout=RUNTIME_SECONDS_SANITY_CHECK)
+        except subprocess.TimeoutExpired:
+            return
 
-        self.assertEqual(exit_code, None, msg="Process has not exited")
+        self.fail(f"Process exited early with code {exit_code}")
 
     def tearDown(self):
         """
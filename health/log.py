@@ -9,9 +9,16 @@ It defines a logger object and adds two handlers to it:
     The log messages are formatted with a time stamp, logger name, log level, 
     and message. The log file is stored in the logs directory with the name 
     whendidtherocketlaunch_bot.log.
+
+    Both handlers run on a background QueueListener thread, so logging from the
+    bot's event loop only puts the record on a queue. The log file is not rotated
+    by the bot; rotate it externally (eg. logrotate), the file handler reopens it
+    when it is moved.
 """
+import atexit
 import logging
 import logging.handlers
+import queue
 import time
 import os
 
@@ -30,13 +37,18 @@ formatter.converter = time.gmtime
 ch = logging.StreamHandler()
 ch.setLevel(CONSOLE_LEVEL)
 ch.setFormatter(formatter)
-logger.addHandler(ch)
 
 # Log to file
 filepath = os.path.join(
     os.path.dirname(__file__), *["logs", "whendidtherocketlaunch_bot.log"]
 )
-fh = logging.handlers.RotatingFileHandler(filepath, maxBytes=1024 * 1024, backupCount=1)
+fh = logging.handlers.WatchedFileHandler(filepath, delay=True)
 fh.setLevel(FILE_LEVEL)
 fh.setFormatter(formatter)
-logger.addHandler(fh)
+
+# Hand records over to the handlers on a background thread
+log_queue = queue.Queue(-1)
+listener = logging.handlers.QueueListener(log_queue, ch, fh, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
@@ -3,47 +3,72 @@ Provides classes for working with a video API.
 
 It contains the following classes:
 
-Video: a named tuple representing a video in the API.
+Video: a dataclass holding the video metadata used from the API.
 FrameX: a utility class that provides access to the FrameX API.
 FrameXBisector: a class that helps manage the display of images from a video launch.
 """
 
+import atexit
+import functools
 import os
 
-from typing import List, NamedTuple, Text
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Set
 from urllib.parse import quote, urljoin
 
-import requests
+import httpx
+import orjson
+from diskcache import Cache
 
 API_BASE = os.getenv("API_BASE", "https://framex-dev.wadrid.net/api/")
 VIDEO_NAME = os.getenv(
     "VIDEO_NAME", "Falcon Heavy Test Flight (Hosted Webcast)-wbSwFU6tY1c"
 )
+FRAME_CACHE_DIR = os.getenv(
+    "FRAME_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "framex")
+)
+FRAME_CACHE_SIZE_LIMIT = 2**30
+
+# Shared by every FrameX instance, so all conversations reuse the same
+# kept-alive HTTP/2 connections instead of each opening its own
+_SESSION = httpx.Client(
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+)
+atexit.register(_SESSION.close)
+
+# Frames never change, so they are kept on disk across restarts. A single
+# cache is shared by every FrameX instance, as each Cache holds an SQLite
+# connection per thread that uses it
+_CACHE = Cache(
+    FRAME_CACHE_DIR,
+    size_limit=FRAME_CACHE_SIZE_LIMIT,
+    eviction_policy="least-recently-used",
+)
+atexit.register(_CACHE.close)
+
+# Prefetches of every bisector run on one pool, so idle conversations do not
+# each keep their own worker threads alive
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="framex-prefetch")
 
 
-class Video(NamedTuple):
+@dataclass(frozen=True)
+class Video:
     """
-    Represents a video from the API.
+    Represents a video from the API, keeping only the fields the bisector needs.
 
     Attributes:
         name (str): The name of the video.
-        width (int): The width of the video in pixels.
-        height (int): The height of the video in pixels.
         frames (int): The total number of frames in the video.
-        frame_rate (List[int]): A list of integers representing the frames per second (fps).
-        url (str): The URL of the video.
-        first_frame (str): The filename or path of the first frame of the video.
-        last_frame (str): The filename or path of the last frame of the video.
     """
 
-    name: Text
-    width: int
-    height: int
+    # Declared by hand as dataclass(slots=True) needs Python 3.10
+    __slots__ = ("name", "frames")
+
+    name: str
     frames: int
-    frame_rate: List[int]
-    url: Text
-    first_frame: Text
-    last_frame: Text
 
 
 class FrameX:
@@ -52,20 +77,21 @@ class FrameX:
 
     Public Methods:
     ---------------
-    video(video: Text) -> Video:
+    video(video: str) -> Video:
         Fetches information about the specified video.
-    video_frame(video: Text, frame: int) -> bytes:
-        Fetches the JPEG data of the specified frame from the specified video.
+    video_frame(video: str, frame: int) -> bytes:
+        Fetches the JPEG data of the specified frame from the specified video,
+        using the on-disk frame cache when possible.
 
     Public Instance Variables:
     --------------------------
     api_base: str
         The base URL for the FrameX API.
-    session: requests.Session
-        The session used for HTTP requests.
+    session: httpx.Client
+        The HTTP/2 client used for HTTP requests, shared by all instances.
     """
 
-    def __init__(self, api_base: str = API_BASE):
+    def __init__(self, api_base: str = API_BASE, cache: Cache = _CACHE):
         """
         Initializes a new instance of the `FrameX` class.
 
@@ -73,24 +99,21 @@ class FrameX:
         -----------
         api_base: str
             The base URL for the FrameX API.
+        cache: diskcache.Cache
+            The on-disk LRU cache of downloaded frames, shared by all instances
+            by default.
         """
         self.api_base = api_base
-        self.session = requests.Session()
-        self.session.timeout = 30
-
-    def __del__(self):
-        """
-        Close the HTTP session when the FrameX instance is garbage collected
-        """
-        self.session.close()
+        self._cache = cache
+        self.session = _SESSION
 
-    def video(self, video: Text) -> Video:
+    def video(self, video: str) -> Video:
         """
         Fetches information about the specified video.
 
         Parameters:
         -----------
-        video: Text
+        video: str
             The name of the video to fetch information about.
 
         Returns:
@@ -100,20 +123,23 @@ class FrameX:
 
         Raises:
         -------
-        requests.exceptions.HTTPError:
+        httpx.HTTPStatusError:
             If the server returns an error response.
         """
         response = self.session.get(urljoin(self.api_base, f"video/{quote(video)}/"))
         response.raise_for_status()
-        return Video(**response.json())
+        data = orjson.loads(response.content)
+        return Video(name=data["name"], frames=data["frames"])
 
-    def video_frame(self, video: Text, frame: int) -> bytes:
+    def video_frame(self, video: str, frame: int) -> bytes:
         """
         Fetches the JPEG data of the specified frame from the specified video.
+        Downloaded frames are stored in the on-disk cache and served from there
+        on later calls.
 
         Parameters:
         -----------
-        video: Text
+        video: str
             The name of the video to fetch the frame from.
         frame: int
             The index of the frame to fetch.
@@ -125,23 +151,34 @@ class FrameX:
 
         Raises:
         -------
-        requests.exceptions.HTTPError:
+        httpx.HTTPStatusError:
             If the server returns an error response.
         """
+        key = f"{video}:{frame}"
+        data = self._cache.get(key)
+        if data is not None:
+            return data
 
+        # JPEG is already compressed, so ask for the body as is: it is then read
+        # straight into bytes without going through a decompressor
         response = self.session.get(
-            urljoin(self.api_base, f'video/{quote(video)}/frame/{quote(f"{frame}")}/')
+            urljoin(self.api_base, f'video/{quote(video)}/frame/{quote(f"{frame}")}/'),
+            headers={"Accept-Encoding": "identity"},
         )
         response.raise_for_status()
-        return response.content
+        data = response.content
+        self._cache.set(key, data)
+        return data
 
 
-class FrameXBisector:
+class FrameXBisector:  # pylint: disable=too-many-instance-attributes
     """
     A class that helps manage the display of images from a video launch.
 
     Public Methods:
     ---------------
+    warmup()
+        Start downloading the first frame and both frames that can follow it.
     go_to_mid()
         Move the current index to the midpoint of the current range.
     process_input(current_has_taken_off: bool)
@@ -171,7 +208,13 @@ class FrameXBisector:
             The name of the video to retrieve frames from.
         """
         self.api = FrameX(api_base)
-        self.video = self.api.video(video_name)
+        video = self.api.video(video_name)
+        self._name = video.name
+        self._count = video.frames
+        # Memoised on the bound method, as lru_cache on a method would keep self alive.
+        # Only the frame shown last can be revisited, by the final go_to_mid
+        self._cached_frame = functools.lru_cache(maxsize=2)(self.api.video_frame)
+        self._prefetched: Dict[int, Future] = {}
         self._index = 0
         self.image = None
         self.left = 0
@@ -192,7 +235,8 @@ class FrameXBisector:
     @index.setter
     def index(self, value):
         """
-        Sets the current frame index and downloads the new frame.
+        Sets the current frame index and downloads the new frame, then starts
+        prefetching the frames that either answer to it can lead to.
 
         Parameters:
         -----------
@@ -201,7 +245,58 @@ class FrameXBisector:
         """
 
         self._index = value
-        self.image = self.api.video_frame(self.video.name, value)
+        future = self._prefetched.pop(value, None)
+        self.image = None
+        # A prefetch still queued behind other users' is cancelled and fetched
+        # directly, so only downloads already under way are waited on
+        if future is not None and not future.cancel():
+            try:
+                self.image = future.result()
+            except httpx.HTTPError:
+                # The prefetch may have failed long before the user answered,
+                # so retry now instead of surfacing a stale error
+                pass
+        if self.image is None:
+            self.image = self._cached_frame(self._name, value)
+        self._prefetch(self._next_frames(value))
+
+    def _next_frames(self, index: int) -> Set[int]:
+        """
+        Gets the frames that go_to_mid can move to once index has been answered.
+
+        Parameters:
+        -----------
+        index: int
+            The frame index being shown to the user.
+
+        Returns:
+        --------
+        Set[int]:
+            The midpoints of the ranges left by a True and by a False answer.
+        """
+        return {
+            (self.left + index) // 2,
+            (min(index + 1, self.right) + self.right) // 2,
+        }
+
+    def _prefetch(self, frames: Set[int]):
+        """
+        Starts downloading the given frames in the background, dropping any
+        prefetched frame that is no longer needed.
+
+        Parameters:
+        -----------
+        frames: Set[int]
+            The frame indexes to prefetch.
+        """
+        for stale in set(self._prefetched) - frames:
+            self._prefetched.pop(stale).cancel()
+        for frame in frames - set(self._prefetched):
+            # Bypasses the memo, so a prefetch still running after reset() cannot
+            # write its frame back into it
+            self._prefetched[frame] = _EXECUTOR.submit(
+                self.api.video_frame, self._name, frame
+            )
 
     @property
     def count(self):
@@ -213,7 +308,16 @@ class FrameXBisector:
         int:
             The total number of frames in the video.
         """
-        return self.video.frames
+        return self._count
+
+    def warmup(self):
+        """
+        Starts downloading, in the background, the frame go_to_mid will move to
+        next together with both frames that can follow it, so the next frame is
+        ready by the time the user answers.
+        """
+        mid = (self.left + self.right) // 2
+        self._prefetch({mid} | self._next_frames(mid))
 
     def go_to_mid(self):
         """
@@ -242,15 +346,19 @@ class FrameXBisector:
         current_has_taken_off: bool
             Indicates whether the current image shows the rocket taking off or not.
         """
+        index = self._index
         if current_has_taken_off:
-            self.right = self.index
+            self.right = index
         else:
-            self.left = min(self.index + 1, self.right)
+            # index <= right, so index + 1 only overshoots once already converged
+            self.left = index + 1 if index < self.right else self.right
 
     def reset(self):
         """
         Resets all attributes to their default values.
         """
+        self._prefetch(set())
+        self._cached_frame.cache_clear()
         self._index = 0
         self.image = None
         self.left = 0
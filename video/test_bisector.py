@@ -2,10 +2,87 @@
 Unit tests for video and related functionality.
 """
 
+import shutil
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 
-from video.bisector import FrameXBisector
+import httpx
+from diskcache import Cache
+
+from video.bisector import FrameX, FrameXBisector, Video
+
+
+class TestFrameX(unittest.TestCase):
+    """
+    Unit tests for the FrameX class.
+    """
+
+    def setUp(self):
+        """
+        Set up a FrameX object with a temporary frame cache, whose requests are
+        answered by a mock transport: only the metadata of mock_video and its
+        frame 1 exist.
+        """
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        self.cache = Cache(cache_dir)
+        self.addCleanup(self.cache.close)
+        self.requests = []
+        self.metadata = {
+            "name": "mock_video",
+            "width": 1280,
+            "height": 720,
+            "frames": 10,
+            "frame_rate": [30, 1],
+            "url": "https://example.com/api/video/mock_video/",
+            "first_frame": "https://example.com/api/video/mock_video/frame/0/",
+            "last_frame": "https://example.com/api/video/mock_video/frame/9/",
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.url.path.endswith("/video/mock_video/"):
+                return httpx.Response(200, json=self.metadata)
+            if request.url.path.endswith("/frame/1/"):
+                return httpx.Response(200, content=b"mock JPEG data")
+            return httpx.Response(404)
+
+        self.api = FrameX("https://example.com/api/", cache=self.cache)
+        self.api.session = httpx.Client(transport=httpx.MockTransport(handler))
+        self.addCleanup(self.api.session.close)
+
+    def test_video(self):
+        """
+        Tests that the video metadata is parsed into a Video with its name and
+        frame count, and that an error response is raised.
+        """
+        self.assertEqual(
+            self.api.video("mock_video"), Video(name="mock_video", frames=10)
+        )
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.api.video("missing_video")
+
+    def test_video_frame_cache(self):
+        """
+        Tests that a frame missing from the cache is downloaded and stored, and
+        that it is then served from the cache without another request.
+        """
+        self.assertEqual(self.api.video_frame("mock_video", 1), b"mock JPEG data")
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.cache.get("mock_video:1"), b"mock JPEG data")
+
+        self.assertEqual(self.api.video_frame("mock_video", 1), b"mock JPEG data")
+        self.assertEqual(len(self.requests), 1)
+
+    def test_video_frame_error(self):
+        """
+        Tests that an error response is raised and not stored in the cache.
+        """
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.api.video_frame("mock_video", 2)
+        self.assertNotIn("mock_video:2", self.cache)
 
 
 class TestFrameXBisector(unittest.TestCase):
@@ -27,8 +104,9 @@ class TestFrameXBisector(unittest.TestCase):
         self.mock_video.name = "mock_video"
         self.mock_video.frames = 10
         self.mock_video.url = "https://example.com/api/video/mock_video/"
-        mock_FrameX.return_value.video.return_value = self.mock_video
-        mock_FrameX.return_value.video_frame.return_value = b"mock JPEG data"
+        self.mock_api = mock_FrameX.return_value
+        self.mock_api.video.return_value = self.mock_video
+        self.mock_api.video_frame.return_value = b"mock JPEG data"
 
         # Create a FrameXBisector object
         self.bisector = FrameXBisector()
@@ -64,6 +142,18 @@ class TestFrameXBisector(unittest.TestCase):
         self.bisector.go_to_mid()
         self.assertEqual(self.bisector.index, 1)
 
+    def test_warmup(self):
+        """
+        Tests that the first midpoint frame downloaded by warmup() is reused by
+        go_to_mid() rather than downloaded again.
+        """
+        self.bisector.warmup()
+        self.bisector.go_to_mid()
+        self.assertEqual(self.bisector.index, 4)
+        self.assertEqual(self.bisector.image, b"mock JPEG data")
+        frames = [call.args[1] for call in self.mock_api.video_frame.call_args_list]
+        self.assertEqual(frames.count(4), 1)
+
     def test_is_finished(self):
         """
         Tests that the is_finished() method of the FrameXBisector object returns True
@@ -97,14 +187,83 @@ class TestFrameXBisector(unittest.TestCase):
         self.bisector.process_input(False)
         self.assertEqual(self.bisector.left, 6)
 
+    def test_reset(self):
+        """
+        Tests that reset() restores the search bounds and drops the current image,
+        the pending prefetches and the memoised frames.
+        """
+        # pylint: disable=protected-access
+        self.bisector.warmup()
+        # Frame 3 is not prefetched, so it is fetched through the memo
+        self.bisector.index = 3
+        self.bisector.process_input(True)
+        self.assertTrue(self.bisector._prefetched)
+        self.assertGreater(self.bisector._cached_frame.cache_info().currsize, 0)
+
+        self.bisector.reset()
+
+        self.assertEqual(self.bisector.index, 0)
+        self.assertEqual(self.bisector.left, 0)
+        self.assertEqual(self.bisector.right, self.bisector.count - 1)
+        self.assertIsNone(self.bisector.image)
+        self.assertEqual(self.bisector._prefetched, {})
+        self.assertEqual(self.bisector._cached_frame.cache_info().currsize, 0)
+
+    @staticmethod
+    def _make_bisector(frames: int, takeoff_index: int) -> FrameXBisector:
+        """
+        Create a FrameXBisector over a mock video whose frames show the takeoff
+        from takeoff_index onwards.
+
+        Args:
+            frames (int): The number of frames in the mock video.
+            takeoff_index (int): The first frame showing the takeoff.
+
+        Returns:
+            FrameXBisector: A bisector with its own mock API.
+        """
+
+        # Define a mock API response
+        def mock_video_frame(_video_name: str, frame_number: int) -> bytes:
+            if frame_number < takeoff_index:
+                return b"mock JPEG data"
+            return b"mock JPEG data with takeoff"
+
+        with patch("video.bisector.FrameX") as mock_framex:
+            mock_video = Mock(name="Video")
+            mock_video.name = "mock_video"
+            mock_video.frames = frames
+            mock_framex.return_value.video.return_value = mock_video
+            mock_framex.return_value.video_frame.side_effect = mock_video_frame
+            return FrameXBisector()
+
+    @staticmethod
+    def _search(bisector: FrameXBisector):
+        """
+        Search for the takeoff frame, answering from the contents of each image.
+
+        Args:
+            bisector (FrameXBisector): The bisector to search with.
+
+        Returns:
+            tuple: The index found and the number of tries it took.
+        """
+        tries = 0
+        while not bisector.is_finished:
+            tries += 1
+            bisector.go_to_mid()
+            bisector.process_input(b"takeoff" in bisector.image)
+        bisector.go_to_mid()
+        return bisector.index, tries
+
     def test_binary_search(self):
         """
         Test the binary_search() functionality of FrameXBisector.
 
         Tests the functionality by searching for the frame with "takeoff" using a mock API response.
-        The method replaces the real API methods with mock ones and simulates user input based on
-        the contents of the frame's image. The test checks that the method correctly identifies the
-        frame with the takeoff and that it takes less than log n tries to do so.
+        Each case gets its own bisector with a mock API, simulating user input based on the
+        contents of the frame's image. The test checks that the correct frame with the takeoff
+        is found and that it takes less than log n tries to do so.
         """
         test_cases = [
             {"frames": frames, "takeoff_index": index}
@@ -113,40 +272,17 @@ class TestFrameXBisector(unittest.TestCase):
         ]
 
         for test_case in test_cases:
-            # Define a mock API response
-            def mock_video_frame(_video_name: str, frame_number: int) -> bytes:
-                if frame_number < test_case["takeoff_index"]:
-                    return b"mock JPEG data"
-                return b"mock JPEG data with takeoff"
-
-            # Replace the real API methods with the mock ones
-            self.bisector.api.video_frame = mock_video_frame
-            self.mock_video.frames = test_case["frames"] + 1
-            self.bisector.reset()
-
-            # Search for the frame with the takeoff
-            print(
-                f"\nTEST: index {test_case['takeoff_index']} in {test_case['frames']} frames"
-            )
-            tries = 0
-            while not self.bisector.is_finished:
-                tries += 1
-                self.bisector.go_to_mid()
-                print(
-                    f"Testing:{self.bisector.index} L:{self.bisector.left} R:{self.bisector.right}"
+            with self.subTest(**test_case):
+                bisector = self._make_bisector(
+                    test_case["frames"] + 1, test_case["takeoff_index"]
                 )
-                has_taken_off = b"takeoff" in self.bisector.image
-                print(f"User input: {has_taken_off}")
-                self.bisector.process_input(has_taken_off)
-                print(f"Now: L: {self.bisector.left} R: {self.bisector.right}")
-            self.bisector.go_to_mid()
-
-            # Check that the correct frame was found
-            self.assertEqual(self.bisector.index, test_case["takeoff_index"])
+                index, tries = self._search(bisector)
 
-            # Check that it took less than log n tries:
-            self.assertLessEqual(tries, self.bisector.count // 2 + 1)
+                # Check that the correct frame was found
+                self.assertEqual(index, test_case["takeoff_index"])
 
+                # Check that it took less than log n tries:
+                self.assertLessEqual(tries, bisector.count // 2 + 1)
 
 if __name__ == "__main__":
     unittest.main()